@@ -2,93 +2,197 @@
 """TrueNAS VM Manager - Create and manage VMs on TrueNAS systems."""
 
 import argparse
+import asyncio
+import functools
 import json
 import logging
 import os
+import re
 import sys
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping, Tuple
 
 from dotenv import load_dotenv
+import msgspec
 import yaml
 from truenas_api_client import Client
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# Upper bound on VMs in flight per create_vm_type() pipeline stage
+MAX_CONCURRENT_VMS = 8
+
+# Seconds between core.ping calls keeping an idle API session alive
+KEEPALIVE_INTERVAL = 20
+
+# Each blocking API call holds a thread until it returns. Size the pool for
+# the create, device and start stages at full concurrency plus the keepalive.
+_API_THREADS = MAX_CONCURRENT_VMS * 3 + 1
+
+_BYTES_PER_GB = 1 << 30
+
 
 class TrueNASError(Exception):
     """Custom exception for TrueNAS API errors."""
     pass
 
 
+class StorageConfig(msgspec.Struct):
+    """Schema of the storage section of config.yaml."""
+    pool_path: str
+    cdrom_path: str
+
+
+class VMTypeConfig(msgspec.Struct):
+    """Schema of a VM type section (controlplane, worker) of config.yaml."""
+    count: int = 0
+    memory: Optional[int] = None
+    cpu: Optional[int] = None
+    disk: Optional[Dict[str, int]] = None
+    network: Optional[Dict[str, str]] = None
+    
+    def __post_init__(self):
+        # A section with no VMs to create may omit everything but count
+        if self.count > 0:
+            missing = [
+                field for field in ("memory", "cpu", "disk", "network")
+                if getattr(self, field) is None
+            ]
+            if missing:
+                raise ValueError(f"Missing required field(s) when count > 0: {', '.join(missing)}")
+
+
+class Config(msgspec.Struct):
+    """Schema of config.yaml."""
+    storage: StorageConfig
+    controlplane: VMTypeConfig
+    worker: VMTypeConfig
+
+
+def _read_template(template_path: Path) -> Dict[str, Any]:
+    """Read and parse a single JSON template file."""
+    try:
+        template = _json_loads(template_path.read_bytes())
+    except FileNotFoundError as e:
+        raise TrueNASError(f"Template file not found: {template_path}")
+    except json.JSONDecodeError as e:
+        raise TrueNASError(f"Invalid JSON in template file {template_path}: {e}")
+    
+    # Specs are copied two levels deep (top level + "attributes"); anything
+    # nested further would be shared between every VM or device spec
+    if not isinstance(template, dict) or not isinstance(template.get("attributes", {}), dict):
+        raise TrueNASError(f"Invalid template structure in {template_path}")
+    nested_values = [value for key, value in template.items() if key != "attributes"]
+    nested_values.extend(template.get("attributes", {}).values())
+    if any(isinstance(value, (dict, list)) for value in nested_values):
+        raise TrueNASError(f"Template {template_path} is nested deeper than top level and 'attributes'")
+    
+    return template
+
+
+def _freeze_template(template: Dict[str, Any]) -> Mapping[str, Any]:
+    """Return a read-only view of a template and its attributes."""
+    frozen = dict(template)
+    if "attributes" in frozen:
+        frozen["attributes"] = MappingProxyType(frozen["attributes"])
+    return MappingProxyType(frozen)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_all_templates(base_path: Path) -> Mapping[str, Mapping[str, Any]]:
+    """Load device templates from JSON files, once per base path."""
+    template_files = {
+        "vm": base_path / "templates" / "vms" / "vm.json",
+        "nic": base_path / "templates" / "devices" / "nic.json",
+        "disk": base_path / "templates" / "devices" / "disk.json",
+        "display": base_path / "templates" / "devices" / "display.json",
+        "cdrom": base_path / "templates" / "devices" / "cdrom.json",
+    }
+    
+    # Read the files concurrently; map() re-raises the first error in order
+    with ThreadPoolExecutor(max_workers=len(template_files)) as executor:
+        templates = executor.map(_read_template, template_files.values())
+        
+        # Shared by every TemplateManager using this base path, so freeze them
+        return MappingProxyType({
+            template_name: _freeze_template(template)
+            for template_name, template in zip(template_files, templates)
+        })
+
+
 class TemplateManager:
     """Manages device templates loaded from JSON files."""
     
     def __init__(self, base_path: Path = None):
         self.base_path = base_path or Path(__file__).parent
-        self.templates = {}
-        self._load_templates()
-    
-    def _load_templates(self) -> None:
-        """Load device templates from JSON files."""
-        template_files = {
-            "vm": self.base_path / "templates" / "vms" / "vm.json",
-            "nic": self.base_path / "templates" / "devices" / "nic.json",
-            "disk": self.base_path / "templates" / "devices" / "disk.json",
-            "display": self.base_path / "templates" / "devices" / "display.json",
-            "cdrom": self.base_path / "templates" / "devices" / "cdrom.json",
-        }
-        
-        for template_name, template_path in template_files.items():
-            try:
-                with open(template_path, "r", encoding="utf-8") as f:
-                    self.templates[template_name] = json.load(f)
-            except FileNotFoundError as e:
-                raise TrueNASError(f"Template file not found: {template_path}")
-            except json.JSONDecodeError as e:
-                raise TrueNASError(f"Invalid JSON in template file {template_path}: {e}")
+        self.templates = _load_all_templates(self.base_path)
     
     def create_vm_spec(self, name: str, cores: int, threads: int, memory: int) -> Dict[str, Any]:
         """Create VM specification from template."""
-        vm_spec = deepcopy(self.templates["vm"])
-        vm_spec.update({
+        return {
+            **self.templates["vm"],
             "name": name,
             "cores": cores,
             "threads": threads,
             "memory": memory
-        })
-        return vm_spec
+        }
     
     def create_display_device(self, vm_id: int, port: int, password: str) -> Dict[str, Any]:
         """Create VNC display device from template."""
-        display = deepcopy(self.templates["display"])
-        display["vm"] = vm_id
-        display["attributes"]["port"] = port
-        display["attributes"]["password"] = password
-        return display
+        template = self.templates["display"]
+        return {
+            **template,
+            "vm": vm_id,
+            "attributes": {**template["attributes"], "port": port, "password": password}
+        }
     
     def create_cdrom_device(self, vm_id: int, path: str) -> Dict[str, Any]:
         """Create CDROM device from template."""
-        cdrom = deepcopy(self.templates["cdrom"])
-        cdrom["vm"] = vm_id
-        cdrom["attributes"]["path"] = path
-        return cdrom
+        template = self.templates["cdrom"]
+        return {
+            **template,
+            "vm": vm_id,
+            "attributes": {**template["attributes"], "path": path}
+        }
     
     def create_nic_device(self, vm_id: int, nic_attach: str, mac: str = None) -> Dict[str, Any]:
         """Create network interface device from template."""
-        nic = deepcopy(self.templates["nic"])
-        nic["vm"] = vm_id
-        nic["attributes"]["nic_attach"] = nic_attach
-        if mac:
-            nic["attributes"]["mac"] = mac
-        return nic
+        template = self.templates["nic"]
+        return {
+            **template,
+            "vm": vm_id,
+            "attributes": {
+                **template["attributes"],
+                "nic_attach": nic_attach,
+                **({"mac": mac} if mac else {})
+            }
+        }
     
     def create_disk_device(self, vm_id: int, zvol_name: str, size_bytes: int) -> Dict[str, Any]:
         """Create disk device from template."""
-        disk = deepcopy(self.templates["disk"])
-        disk["vm"] = vm_id
-        disk["attributes"]["zvol_name"] = zvol_name
-        disk["attributes"]["zvol_volsize"] = size_bytes
-        return disk
+        template = self.templates["disk"]
+        return {
+            **template,
+            "vm": vm_id,
+            "attributes": {**template["attributes"], "zvol_name": zvol_name, "zvol_volsize": size_bytes}
+        }
 
 
 class VMManager:
@@ -100,84 +204,140 @@ class VMManager:
         self.username = username
         self.password = password
         self.vnc_password = vnc_password
+        # Single API session for the lifetime of the manager: every call goes
+        # through _call() on this client, never through a fresh connection.
         self.client: Optional[Client] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
         self.logger = logging.getLogger(__name__)
         self.templates = template_manager or TemplateManager()
     
-    def __enter__(self):
-        """Context manager entry."""
-        self.connect()
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
         return self
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.disconnect()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.disconnect()
+    
+    async def _call(self, method: str, *params: Any, job: bool = False) -> Any:
+        """Call a TrueNAS API method without blocking the event loop."""
+        if self.client is None:
+            raise TrueNASError("Not connected to TrueNAS")
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(self.client.call, method, *params, job=job)
+        )
+    
+    async def _keepalive(self) -> None:
+        """Ping TrueNAS periodically so the idle session is not dropped."""
+        while True:
+            await asyncio.sleep(KEEPALIVE_INTERVAL)
+            try:
+                await self._call("core.ping")
+            except Exception as e:
+                self.logger.warning("Keepalive ping failed: %s", e)
     
-    def connect(self) -> None:
+    async def connect(self) -> None:
         """Establish connection to TrueNAS API."""
+        if self.client is not None:
+            return
+        
+        self._executor = ThreadPoolExecutor(max_workers=_API_THREADS, thread_name_prefix="truenas-api")
         try:
-            self.client = Client(f"ws://{self.host}/api/current")
-            if not self.client.call("auth.login", self.username, self.password):
+            self.client = await asyncio.get_running_loop().run_in_executor(
+                self._executor, Client, f"ws://{self.host}/api/current"
+            )
+            if not await self._call("auth.login", self.username, self.password):
                 raise TrueNASError("Authentication failed")
             self.logger.info("Successfully connected to TrueNAS at %s", self.host)
         except Exception as e:
+            # Never authenticated, so there is no session to log out of
+            await self._close_client()
             raise TrueNASError(f"Connection failed: {e}")
+        
+        self._keepalive_task = asyncio.create_task(self._keepalive())
     
-    def disconnect(self) -> None:
+    async def disconnect(self) -> None:
         """Close connection to TrueNAS API."""
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            try:
+                await self._keepalive_task
+            except asyncio.CancelledError:
+                pass
+            self._keepalive_task = None
+        
         if self.client:
             try:
-                self.client.call("auth.logout")
-                self.client.close()
+                await self._call("auth.logout")
+            except Exception as e:
+                self.logger.warning("Error during logout: %s", e)
+        
+        await self._close_client()
+    
+    async def _close_client(self) -> None:
+        """Close the API socket and shut down its thread pool."""
+        if self.client:
+            try:
+                await asyncio.get_running_loop().run_in_executor(self._executor, self.client.close)
                 self.logger.info("Disconnected from TrueNAS")
             except Exception as e:
                 self.logger.warning("Error during disconnect: %s", e)
+            finally:
+                self.client = None
+        
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
     
-    def _add_device(self, device: Dict[str, Any]) -> None:
-        """Add a device to a VM."""
+    async def _add_devices(self, vm_name: str, devices: List[Dict[str, Any]]) -> None:
+        """Add devices to a VM in a single core.bulk round-trip."""
         try:
-            self.client.call("vm.device.create", device)
-            device_type = device.get("attributes", {}).get("dtype", "unknown")
-            self.logger.info("Added device: %s", device_type)
+            results = await self._call(
+                "core.bulk", "vm.device.create", [[device] for device in devices], job=True
+            )
         except Exception as e:
+            raise TrueNASError(f"Failed to add devices to VM {vm_name}: {e}")
+        
+        failures = []
+        for device, result in zip(devices, results):
             device_type = device.get("attributes", {}).get("dtype", "unknown")
-            raise TrueNASError(f"Failed to add device {device_type}: {e}")
+            if result["error"] is not None:
+                failures.append(f"{device_type}: {result['error']}")
+            else:
+                self.logger.info("Added device to VM %s: %s", vm_name, device_type)
+        
+        if failures:
+            raise TrueNASError(f"Failed to add device(s) to VM {vm_name}: {'; '.join(failures)}")
     
-    def _create_vm_devices(self, vm_id: int, vm_name: str, vm_config: Dict[str, Any], 
-                          vnc_port: int, storage_config: Dict[str, Any]) -> None:
+    async def _create_vm_devices(self, vm_id: int, vm_name: str, vm_config: Dict[str, Any], 
+                                 vnc_port: int, storage_config: Dict[str, Any]) -> None:
         """Create and attach devices to a VM."""
         # Display device
-        display = self.templates.create_display_device(vm_id, vnc_port, self.vnc_password)
-        self._add_device(display)
+        devices = [self.templates.create_display_device(vm_id, vnc_port, self.vnc_password)]
         
         # CDROM device
         cdrom_path = storage_config["cdrom_path"]
-        cdrom = self.templates.create_cdrom_device(vm_id, cdrom_path)
-        self._add_device(cdrom)
+        devices.append(self.templates.create_cdrom_device(vm_id, cdrom_path))
         
         # Network interfaces
         for nic_attach in vm_config["network"].values():
-            nic = self.templates.create_nic_device(vm_id, nic_attach)
-            self._add_device(nic)
+            devices.append(self.templates.create_nic_device(vm_id, nic_attach))
         
         # Storage devices
-        storage_pool_path = storage_config["pool_path"]
+        zvol_prefix = f"{storage_config['pool_path']}/{vm_name}-disk"
         for disk_idx, size_gb in enumerate(vm_config["disk"].values()):
-            size_bytes = size_gb * (1024 ** 3)  # Convert GB to bytes
-            zvol_name = f"{storage_pool_path}/{vm_name}-disk{disk_idx}"
-            disk = self.templates.create_disk_device(vm_id, zvol_name, size_bytes)
-            self._add_device(disk)
-    
-    def create_vm_type(self, config: Dict[str, Any], vm_type: str, vnc_start_port: int) -> None:
-        """Create VMs of a specific type."""
-        vm_config = config.get(vm_type)
-        storage_config = config.get("storage")
-        
-        if not vm_config:
-            raise TrueNASError(f"VM type '{vm_type}' not found in configuration")
+            zvol_name = zvol_prefix + str(disk_idx)
+            devices.append(self.templates.create_disk_device(vm_id, zvol_name, size_gb * _BYTES_PER_GB))
         
-        if not storage_config:
-            raise TrueNASError("Storage configuration not found in config")
+        await self._add_devices(vm_name, devices)
+    
+    async def create_vm_type(self, config: Dict[str, Any], vm_type: str, vnc_start_port: int) -> None:
+        """Create VMs of a specific type through a create -> devices -> start pipeline."""
+        # The sections are guaranteed by load_configuration()'s schema
+        vm_config = config[vm_type]
+        storage_config = config["storage"]
         
         count = vm_config.get("count", 0)
         if count <= 0:
@@ -188,19 +348,78 @@ class VMManager:
         self.logger.info("Using storage pool path: %s", storage_config["pool_path"])
         self.logger.info("Using CDROM ISO path: %s", storage_config["cdrom_path"])
         
-        for idx in range(count):
-            vm_name = f"{vm_type}{idx + 1:02d}"
-            vnc_port = vnc_start_port + idx + 1
-            
+        async def create(vm_name: str, vnc_port: int) -> tuple:
+            vm_id = await self._create_vm(vm_name, vm_config)
+            return vm_name, vm_id, vnc_port
+        
+        pending_starts: List[Tuple[str, asyncio.Task]] = []
+        start_slots = asyncio.Semaphore(MAX_CONCURRENT_VMS)
+        
+        async def start(vm_name: str, vm_id: int) -> None:
+            async with start_slots:
+                await self._start_vm(vm_id, vm_name)
+        
+        async def configure(vm_name: str, vm_id: int, vnc_port: int) -> None:
             try:
-                self._create_single_vm(vm_name, vm_config, vnc_port, storage_config)
-            except TrueNASError as e:
-                self.logger.error("Failed to create VM %s: %s", vm_name, e)
-                continue
-    
-    def _create_single_vm(self, vm_name: str, vm_config: Dict[str, Any], vnc_port: int,
-                         storage_config: Dict[str, Any]) -> None:
-        """Create a single VM with all its devices."""
+                await self._create_vm_devices(vm_id, vm_name, vm_config, vnc_port, storage_config)
+            except Exception as e:
+                await self._abort_vm(vm_id, vm_name, e)
+                raise TrueNASError(f"VM configuration failed: {e}") from e
+            
+            # Dispatch the start; starts are awaited once every VM is configured
+            task = asyncio.create_task(start(vm_name, vm_id))
+            pending_starts.append((vm_name, task))
+        
+        unexpected_errors: List[Exception] = []
+        
+        async def run_stage(inbox: asyncio.Queue, outbox: Optional[asyncio.Queue], handler) -> None:
+            while True:
+                vm_name, *args = await inbox.get()
+                try:
+                    result = await handler(vm_name, *args)
+                    if outbox is not None:
+                        outbox.put_nowait(result)
+                except TrueNASError as e:
+                    self.logger.error("Failed to create VM %s: %s", vm_name, e)
+                except Exception as e:
+                    unexpected_errors.append(e)
+                finally:
+                    inbox.task_done()
+        
+        # The create stage hands VMs to the device stage through a queue, so one
+        # VM's devices are created while the next VM is still being created
+        pending: asyncio.Queue = asyncio.Queue()
+        created: asyncio.Queue = asyncio.Queue()
+        stages = ((pending, created, create), (created, None, configure))
+        workers = [
+            asyncio.create_task(run_stage(inbox, outbox, handler))
+            for inbox, outbox, handler in stages
+            for _ in range(min(count, MAX_CONCURRENT_VMS))
+        ]
+        
+        for idx in range(count):
+            pending.put_nowait((f"{vm_type}{idx + 1:02d}", vnc_start_port + idx + 1))
+        
+        try:
+            for queue in (pending, created):
+                await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        
+        results = await asyncio.gather(*(task for _, task in pending_starts), return_exceptions=True)
+        for (vm_name, _), result in zip(pending_starts, results):
+            if isinstance(result, TrueNASError):
+                self.logger.error("Failed to create VM %s: %s", vm_name, result)
+            elif isinstance(result, Exception):
+                unexpected_errors.append(result)
+        
+        if unexpected_errors:
+            raise unexpected_errors[0]
+    
+    async def _create_vm(self, vm_name: str, vm_config: Dict[str, Any]) -> int:
+        """Create a VM without devices and return its ID."""
         # Create VM specification
         vm_spec = self.templates.create_vm_spec(
             name=vm_name,
@@ -211,42 +430,47 @@ class VMManager:
         
         # Create the VM
         try:
-            response = self.client.call("vm.create", vm_spec)
+            response = await self._call("vm.create", vm_spec)
             vm_id = response["id"]
             self.logger.info("Created VM: %s (ID: %s)", vm_name, vm_id)
+            return vm_id
         except Exception as e:
             raise TrueNASError(f"VM creation failed: {e}")
-        
+    
+    async def _start_vm(self, vm_id: int, vm_name: str) -> None:
+        """Start a VM and wait for its start job to finish."""
         try:
-            # Add devices to the VM
-            self._create_vm_devices(vm_id, vm_name, vm_config, vnc_port, storage_config)
-            
-            # Start the VM
-            self.client.call("vm.start", vm_id)
+            await self._call("vm.start", vm_id, job=True)
             self.logger.info("Started VM: %s", vm_name)
-            
         except Exception as e:
-            # If device creation or startup fails, clean up the VM
-            self.logger.error("Failed to configure VM %s, cleaning up: %s", vm_name, e)
-            try:
-                self.client.call("vm.delete", vm_id, {"zvols": True, "force": True})
-            except Exception as cleanup_error:
-                self.logger.error("Failed to clean up VM %s: %s", vm_name, cleanup_error)
-            raise TrueNASError(f"VM configuration failed: {e}")
+            await self._abort_vm(vm_id, vm_name, e)
+            raise TrueNASError(f"VM configuration failed: {e}") from e
+    
+    async def _abort_vm(self, vm_id: int, vm_name: str, error: Exception) -> None:
+        """Clean up a VM whose configuration failed."""
+        self.logger.error("Failed to configure VM %s, cleaning up: %s", vm_name, error)
+        try:
+            await self._call("vm.delete", vm_id, {"zvols": True, "force": True})
+        except Exception as cleanup_error:
+            self.logger.error("Failed to clean up VM %s: %s", vm_name, cleanup_error)
     
-    def destroy_managed_vms(self, vm_prefixes: List[str] = None) -> None:
+    async def destroy_managed_vms(self, vm_prefixes: List[str] = None) -> None:
         """Destroy VMs with specific name prefixes."""
         if vm_prefixes is None:
             vm_prefixes = ["controlplane", "worker"]
         
         try:
-            vms = self.client.call("vm.query")
+            # Only id and name are needed; select keeps the response payload small
+            vms = await self._call("vm.query", [], {"select": ["id", "name"]})
         except Exception as e:
             raise TrueNASError(f"Failed to query VMs: {e}")
         
+        # One compiled alternation matches every prefix in a single pass; an
+        # empty alternation would match every VM, so no prefixes means no VMs
+        prefix_pattern = re.compile("|".join(map(re.escape, vm_prefixes))) if vm_prefixes else None
         managed_vms = [
             vm for vm in vms 
-            if any(vm["name"].startswith(prefix) for prefix in vm_prefixes)
+            if prefix_pattern and prefix_pattern.match(vm["name"])
         ]
         
         if not managed_vms:
@@ -255,23 +479,32 @@ class VMManager:
         
         self.logger.info("Found %d managed VM(s) to destroy", len(managed_vms))
         
-        for vm in managed_vms:
-            vm_id = vm["id"]
-            vm_name = vm["name"]
-            
-            try:
-                # Power off VM
-                self.client.call("vm.poweroff", vm_id)
-                self.logger.info("Powered off VM: %s", vm_name)
-            except Exception as e:
-                self.logger.warning("Failed to power off VM %s: %s", vm_name, e)
-            
-            try:
-                # Delete VM and associated storage
-                self.client.call("vm.delete", vm_id, {"zvols": True, "force": True})
-                self.logger.info("Deleted VM: %s", vm_name)
-            except Exception as e:
-                self.logger.error("Failed to delete VM %s: %s", vm_name, e)
+        # Power off all VMs concurrently
+        results = await asyncio.gather(
+            *(self._call("vm.poweroff", vm["id"]) for vm in managed_vms),
+            return_exceptions=True
+        )
+        for vm, result in zip(managed_vms, results):
+            if isinstance(result, Exception):
+                self.logger.warning("Failed to power off VM %s: %s", vm["name"], result)
+            else:
+                self.logger.info("Powered off VM: %s", vm["name"])
+        
+        # Delete VMs and associated storage in a single core.bulk round-trip
+        try:
+            results = await self._call(
+                "core.bulk", "vm.delete",
+                [[vm["id"], {"zvols": True, "force": True}] for vm in managed_vms],
+                job=True
+            )
+        except Exception as e:
+            raise TrueNASError(f"Failed to delete VMs: {e}")
+        
+        for vm, result in zip(managed_vms, results):
+            if result["error"] is not None:
+                self.logger.error("Failed to delete VM %s: %s", vm["name"], result["error"])
+            else:
+                self.logger.info("Deleted VM: %s", vm["name"])
 
 
 def load_configuration(config_path: str = "config.yaml") -> Dict[str, Any]:
@@ -281,20 +514,14 @@ def load_configuration(config_path: str = "config.yaml") -> Dict[str, Any]:
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-        with open(config_file, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-        
-        # Validate configuration structure
-        required_keys = ["storage", "controlplane", "worker"]
-        for key in required_keys:
-            if key not in config:
-                raise ValueError(f"Missing required configuration section: {key}")
+        # Read the file in one call rather than letting the parser stream it
+        config = yaml.load(config_file.read_bytes(), Loader=SafeLoader)
         
-        # Validate storage configuration
-        storage_required_fields = ["pool_path", "cdrom_path"]
-        for field in storage_required_fields:
-            if field not in config["storage"]:
-                raise ValueError(f"Missing required '{field}' in storage configuration")
+        # Validate the whole configuration against the schema in one pass
+        try:
+            msgspec.convert(config, type=Config)
+        except msgspec.ValidationError as e:
+            raise ValueError(f"Invalid configuration: {e}")
         
         return config
         
@@ -337,6 +564,28 @@ def get_environment_variables() -> tuple[str, str, str, str]:
     return truenas_host, api_username, api_password, vnc_password
 
 
+async def main_async(args: argparse.Namespace) -> None:
+    """Run the requested action against TrueNAS."""
+    # Load environment variables
+    truenas_host, api_username, api_password, vnc_password = get_environment_variables()
+    
+    # Load configuration and templates concurrently
+    templates_base_path = Path(args.templates_dir) if args.templates_dir else None
+    config, template_manager = await asyncio.gather(
+        asyncio.to_thread(load_configuration, args.config),
+        asyncio.to_thread(TemplateManager, templates_base_path)
+    )
+    
+    # Execute action
+    async with VMManager(truenas_host, api_username, api_password, vnc_password, 
+                         template_manager) as vm_manager:
+        if args.action == "create":
+            await vm_manager.create_vm_type(config, "controlplane", 5910)
+            await vm_manager.create_vm_type(config, "worker", 5920)
+        elif args.action == "destroy":
+            await vm_manager.destroy_managed_vms()
+
+
 def main() -> None:
     """Main entry point."""
     parser = argparse.ArgumentParser(description="TrueNAS VM Manager")
@@ -368,26 +617,11 @@ def main() -> None:
     setup_logging(args.log_level)
     logger = logging.getLogger(__name__)
     
+    # Prefer the libuv-based event loop when uvloop is installed
+    run = uvloop.run if uvloop is not None else asyncio.run
+    
     try:
-        # Load environment variables
-        truenas_host, api_username, api_password, vnc_password = get_environment_variables()
-        
-        # Load configuration
-        config = load_configuration(args.config)
-        
-        # Initialize template manager
-        templates_base_path = Path(args.templates_dir) if args.templates_dir else None
-        template_manager = TemplateManager(templates_base_path)
-        
-        # Execute action
-        with VMManager(truenas_host, api_username, api_password, vnc_password, 
-                      template_manager) as vm_manager:
-            if args.action == "create":
-                vm_manager.create_vm_type(config, "controlplane", 5910)
-                vm_manager.create_vm_type(config, "worker", 5920)
-            elif args.action == "destroy":
-                vm_manager.destroy_managed_vms()
-        
+        run(main_async(args))
         logger.info("Operation completed successfully")
         
     except (ValueError, TrueNASError, FileNotFoundError) as e: